@@ -5,18 +5,29 @@ Built with the official Model Context Protocol SDK
 """
 
 import os
+import re
+import base64
+import codecs
 import sys
-import json
+import asyncio
 import logging
 import subprocess
-from typing import Any, Dict, List, Optional, Tuple, Union
+import time
+import importlib.util
+import weakref
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import quote
 from datetime import datetime, timezone, timedelta
 
 # GitHub API dependencies
-import jwt
-import requests
-from cryptography.hazmat.primitives import serialization
+import httpx
+import msgspec
+import orjson
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
 
 # MCP SDK imports - following official patterns
 from mcp.server import Server, NotificationOptions
@@ -24,20 +35,153 @@ from mcp.server.models import InitializationOptions
 import mcp.server.stdio
 import mcp.types as types
 
-# Configure logging to stderr (required for stdio servers)
+# Configure logging to stderr (required for stdio servers).
+# FEATHER_LOG_LEVEL=DEBUG also shows httpcore connection events, e.g. to confirm keep-alive reuse.
 logging.basicConfig(
-    level=logging.INFO,
+    level=getattr(logging, os.getenv('FEATHER_LOG_LEVEL', 'INFO').upper(), logging.INFO),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[logging.StreamHandler(sys.stderr)]
 )
 
 logger = logging.getLogger("feather-code")
 
+# httpx logs every request at INFO; keep stderr quiet like requests did
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+# GitHub remote URLs: https://github.com/o/r.git, git@github.com:o/r.git, git://github.com/o/r
+_REMOTE_RE = re.compile(
+    r'^(?:https://|git://|git@)github\.com[:/](?P<owner>[^/]+)/(?P<repo>[^/]+?)(?:\.git)?/?$'
+)
+
+# HTTP/2 lets concurrent tool calls multiplex over one TLS connection; httpx needs the h2 package for it
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+# Maximum number of GET responses kept for ETag revalidation
+ETAG_CACHE_SIZE = 256
+
+# Cap on concurrent requests in a batch, to stay clear of GitHub's secondary rate limits
+MAX_CONCURRENT_REQUESTS = 5
+
+# Cap on requests in flight across all tool calls; GitHub's secondary rate limits
+# allow no more than 100 concurrent requests, which is also the connection pool size
+MAX_IN_FLIGHT_REQUESTS = 100
+
+# Rate-limited requests are retried this often, but only when the wait is at most
+# MAX_RATE_LIMIT_WAIT seconds; longer waits fail fast instead of hanging the tool call
+RATE_LIMIT_RETRIES = 3
+MAX_RATE_LIMIT_WAIT = 60
+
+# Upper bound on pages a single list tool call may fetch
+MAX_PAGES = 10
+
+# Safety cap for all_pages on the REST list tools (10,000 items at per_page=100)
+ALL_PAGES_LIMIT = 100
+
+# get_file_content shows this many characters; UTF-8 needs at most 4 bytes for each
+FILE_PREVIEW_CHARS = 2000
+FILE_PREVIEW_BYTES = FILE_PREVIEW_CHARS * 4
+
+# Files with these extensions are never previewed; only their size is fetched
+_BINARY_EXTENSIONS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp', '.tiff',
+    '.pdf', '.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rar', '.tar', '.jar', '.whl',
+    '.exe', '.dll', '.so', '.dylib', '.a', '.o', '.lib', '.bin', '.class', '.pyc',
+    '.woff', '.woff2', '.ttf', '.otf', '.eot',
+    '.mp3', '.mp4', '.wav', '.ogg', '.flac', '.mov', '.avi', '.mkv', '.webm',
+    '.sqlite', '.db', '.parquet', '.npy', '.pkl',
+})
+
+# Entries of a GitHub Link header: <https://...&page=3>; rel="next"
+_LINK_RE = re.compile(r'<([^>]+)>;\s*rel="(\w+)"')
+
+# Decoded bodies, so a response checked for an error message and then read is decoded once
+_parsed_bodies: "weakref.WeakKeyDictionary[httpx.Response, Any]" = weakref.WeakKeyDictionary()
+
+def _parse(response: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson, once per response; callers must not mutate the result"""
+    try:
+        return _parsed_bodies[response]
+    except KeyError:
+        body = _parsed_bodies[response] = orjson.loads(response.content)
+        return body
+
+def _query_params(params: Dict[str, Any], defaults: "MappingProxyType[str, Any]",
+                  allowed: frozenset) -> Dict[str, Any]:
+    """Build REST query params from tool arguments: defaults, then the allowed keys that were given"""
+    query_params = {**defaults, **{key: params[key] for key in allowed if params.get(key) not in (None, "")}}
+    if query_params.get("per_page", 0) > 100:
+        query_params["per_page"] = 100  # Enforce max limit
+    return query_params
+
+def _page_limit(params: Dict[str, Any]) -> int:
+    """Number of pages a REST list tool may fetch: ALL_PAGES_LIMIT for all_pages, else max_pages"""
+    if params.get("all_pages"):
+        return ALL_PAGES_LIMIT
+    return min(params.get("max_pages", 1), MAX_PAGES)
+
+def _pick(params: Dict[str, Any], keys: Tuple[str, ...]) -> Dict[str, Any]:
+    """Copy the tool arguments named in keys that were given (non-empty) into a request body"""
+    return {key: params[key] for key in keys if params.get(key)}
+
+def _truncate(text: Optional[str], limit: int = 200) -> str:
+    """Shorten a body for list views, slicing at most once"""
+    if not text:
+        return ""
+    return text[:limit] + "..." if len(text) > limit else text
+
+def _page_links(response: httpx.Response) -> Dict[str, int]:
+    """Map Link header relations (next, last, ...) to their page numbers"""
+    links = {}
+    for url, rel in _LINK_RE.findall(response.headers.get('Link', '')):
+        page = httpx.URL(url).params.get('page')
+        if page and page.isdigit():
+            links[rel] = int(page)
+    return links
+
+class TTLCache:
+    """Small LRU cache whose entries expire ttl seconds after they are stored"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        if time.monotonic() >= entry[0]:
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return entry[1]
+    
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def pop(self, key: Any, default: Any = None) -> Any:
+        entry = self._data.pop(key, None)
+        return default if entry is None else entry[1]
+
+# Base64url of {"alg":"RS256","typ":"JWT"}; the App JWT header never changes
+_JWT_HEADER = b"eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCJ9"
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url encoding, as used by JWT"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+def _freeze(mapping: Optional[Dict[str, Any]]) -> Tuple[Tuple[str, str], ...]:
+    """Turn query params or headers into a hashable, order-independent key"""
+    return tuple(sorted((k, str(v)) for k, v in (mapping or {}).items()))
+
 class GitHubClient:
     """GitHub API client with environment-based configuration"""
     
     def __init__(self):
-        # Auto-detect repository from git
+        # Auto-detect repository from git (skipped when both env vars are set)
         self.repo_owner = os.getenv('GITHUB_OWNER')
         self.repo_name = os.getenv('GITHUB_REPO')
         
@@ -48,7 +192,7 @@ class GitHubClient:
                     self.repo_owner = detected[0]
                 if not self.repo_name:
                     self.repo_name = detected[1]
-                logger.info(f"Auto-detected repository: {self.repo_owner}/{self.repo_name}")
+                logger.info("Auto-detected repository: %s/%s", self.repo_owner, self.repo_name)
         
         # Authentication
         self.pat = os.getenv('GITHUB_PAT')
@@ -59,22 +203,73 @@ class GitHubClient:
                     self.pat = f.read().strip()
                 logger.info("Loaded GitHub PAT from file")
             except Exception as e:
-                logger.warning(f"Could not read PAT file: {e}")
+                logger.warning("Could not read PAT file: %s", e)
         
         # GitHub App authentication
         self.app_id = os.getenv('GITHUB_APP_ID')
         self.installation_id = os.getenv('GITHUB_INSTALLATION_ID')
         self.private_key_path = os.getenv('GITHUB_PRIVATE_KEY_PATH')
         
+        # Credentials don't change for the life of the process, so decide once
+        self._uses_app_auth = not self.pat and all([self.app_id, self.installation_id, self.private_key_path])
+        self.is_authenticated = bool(self.pat) or self._uses_app_auth
+        
+        # Cached App credentials; installation tokens are valid for one hour
+        self._private_key = None
+        self._app_token: Optional[str] = None
+        self._app_token_exp: Optional[datetime] = None
+        self._token_lock: Optional[asyncio.Lock] = None
+        
+        # Shared throttle: at most MAX_IN_FLIGHT_REQUESTS in flight, and a gate that
+        # holds every request back while the rate limit is exhausted (created lazily
+        # so they bind to the running event loop)
+        self._limiter: Optional[asyncio.Semaphore] = None
+        self._gate: Optional[asyncio.Event] = None
+        self._gate_reopens = 0.0
+        
+        # GETs in flight, keyed like the conditional request cache, for callers to join
+        self._inflight: Dict[Tuple, "asyncio.Task[httpx.Response]"] = {}
+        
+        # Headers are built once and only rebuilt when the App token rotates
+        self._rebuild_headers()
+        
         # API configuration
         self.api_base = os.getenv('GITHUB_API_URL', 'https://api.github.com')
         
+        # GraphQL lives at /graphql on github.com and /api/graphql on GitHub Enterprise
+        self.graphql_url = re.sub(r'/v3/?$', '', self.api_base) + '/graphql'
+        
+        # Web UI base for building html_url links: github.com, or the Enterprise host
+        self.web_base = ('https://github.com' if self.api_base.rstrip('/') == 'https://api.github.com'
+                         else re.sub(r'/api/v3/?$', '', self.api_base))
+        
+        # Shared async HTTP client so tool calls never block the event loop.
+        # Connections are kept alive and reused, so only the first call pays
+        # for the TCP + TLS handshake; connect failures are retried. Up to 100
+        # requests may be in flight across concurrent tool calls, 20 stay pooled.
+        self.client = httpx.AsyncClient(
+            timeout=30,
+            transport=httpx.AsyncHTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                retries=3,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=MAX_IN_FLIGHT_REQUESTS)
+            )
+        )
+        
+        # Conditional request cache: (url, params, headers) -> last 200 response.
+        # GitHub answers a matching If-None-Match with an empty 304 that does
+        # not count against the rate limit.
+        self._etag_cache: "OrderedDict[Tuple, httpx.Response]" = OrderedDict()
+        
+        # Shaped tool results per cached response, dropped together with the response
+        self._shaped: "weakref.WeakKeyDictionary[httpx.Response, Dict[Callable, Any]]" = weakref.WeakKeyDictionary()
+        
     def _detect_git_repo(self) -> Optional[Tuple[str, str]]:
         """Detect GitHub repository from current git directory"""
         try:
-            # Get the git remote URL
+            # Read the origin URL straight from config (cheaper than `git remote`)
             result = subprocess.run(
-                ['git', 'remote', 'get-url', 'origin'],
+                ['git', 'config', '--get', 'remote.origin.url'],
                 capture_output=True,
                 text=True,
                 check=True,
@@ -82,54 +277,59 @@ class GitHubClient:
             )
             url = result.stdout.strip()
             
-            # Parse GitHub URLs
-            if 'github.com' in url:
-                # Handle HTTPS URLs
-                if url.startswith('https://'):
-                    parts = url.replace('https://github.com/', '').replace('.git', '').split('/')
-                # Handle SSH URLs
-                elif url.startswith('git@'):
-                    parts = url.replace('git@github.com:', '').replace('.git', '').split('/')
-                # Handle git:// URLs
-                elif url.startswith('git://'):
-                    parts = url.replace('git://github.com/', '').replace('.git', '').split('/')
-                else:
-                    return None
-                
-                if len(parts) >= 2:
-                    return (parts[0], parts[1])
+            # Parse HTTPS, SSH and git:// GitHub URLs
+            match = _REMOTE_RE.match(url)
+            if match:
+                return (match['owner'], match['repo'])
         except subprocess.TimeoutExpired:
             logger.warning("Git command timed out")
         except subprocess.CalledProcessError:
             logger.debug("Not in a git repository or no remote origin")
         except Exception as e:
-            logger.debug(f"Error detecting git repo: {e}")
+            logger.debug("Error detecting git repo: %s", e)
         
         return None
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get authentication headers"""
-        headers = {
+    def _rebuild_headers(self) -> None:
+        """Build the request headers; only called at startup and when the App token rotates"""
+        self._headers = {
             'Accept': 'application/vnd.github.v3+json',
             'User-Agent': 'feather-code-mcp/1.0.0'
         }
         
-        if self.pat:
-            headers['Authorization'] = f'token {self.pat}'
-        elif all([self.app_id, self.installation_id, self.private_key_path]):
-            try:
-                token = self._get_app_token()
-                headers['Authorization'] = f'token {token}'
-            except Exception as e:
-                logger.warning(f"GitHub App auth failed: {e}")
+        token = self.pat or self._app_token
+        if token:
+            self._headers['Authorization'] = f'token {token}'
+    
+    async def _get_headers(self) -> Dict[str, str]:
+        """Get authentication headers, refreshing the App token when it is about to expire"""
+        if self._uses_app_auth and self._app_token_expired():
+            if self._token_lock is None:
+                self._token_lock = asyncio.Lock()
+            async with self._token_lock:
+                # Another request may have refreshed the token while we waited
+                if self._app_token_expired():
+                    try:
+                        await self._get_app_token()
+                        self._rebuild_headers()
+                    except Exception as e:
+                        logger.warning("GitHub App auth failed: %s", e)
         
-        return headers
+        return self._headers
+    
+    def _app_token_expired(self) -> bool:
+        """Whether the cached App token is missing or within a minute of expiry"""
+        return not self._app_token or datetime.now(timezone.utc) >= self._app_token_exp - timedelta(seconds=60)
     
-    def _get_app_token(self) -> str:
-        """Get installation token for GitHub App"""
-        # Read private key
-        with open(os.path.expanduser(self.private_key_path), 'rb') as f:
-            private_key = serialization.load_pem_private_key(f.read(), password=None)
+    async def _get_app_token(self) -> str:
+        """Get installation token for GitHub App, reusing it until it is about to expire"""
+        if not self._app_token_expired():
+            return self._app_token
+        
+        # Read private key once
+        if self._private_key is None:
+            with open(os.path.expanduser(self.private_key_path), 'rb') as f:
+                self._private_key = serialization.load_pem_private_key(f.read(), password=None)
         
         # Generate JWT
         now = datetime.now(timezone.utc)
@@ -139,10 +339,13 @@ class GitHubClient:
             'iss': self.app_id
         }
         
-        jwt_token = jwt.encode(payload, private_key, algorithm='RS256')
+        # Sign it directly with the cached key (RS256 = RSASSA-PKCS1-v1_5 over SHA-256)
+        signing_input = _JWT_HEADER + b"." + _b64url(orjson.dumps(payload))
+        signature = self._private_key.sign(signing_input, padding.PKCS1v15(), hashes.SHA256())
+        jwt_token = (signing_input + b"." + _b64url(signature)).decode()
         
         # Exchange JWT for installation token
-        response = requests.post(
+        response = await self.client.post(
             f"{self.api_base}/app/installations/{self.installation_id}/access_tokens",
             headers={
                 'Authorization': f'Bearer {jwt_token}',
@@ -152,29 +355,283 @@ class GitHubClient:
         )
         
         if response.status_code == 201:
-            return response.json()['token']
+            self._app_token = _parse(response)['token']
+            self._app_token_exp = now + timedelta(minutes=55)
+            return self._app_token
         else:
             raise Exception(f"Failed to get installation token: {response.status_code}")
     
-    def request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
-        """Make API request to GitHub"""
-        url = f"{self.api_base}{endpoint}"
+    async def _throttle(self) -> asyncio.Semaphore:
+        """Wait until the rate limit gate is open and return the concurrency limiter"""
+        if self._limiter is None:
+            self._limiter = asyncio.Semaphore(MAX_IN_FLIGHT_REQUESTS)
+            self._gate = asyncio.Event()
+            self._gate.set()
+        await self._gate.wait()
+        return self._limiter
+    
+    def _rate_limit_delay(self, response: httpx.Response) -> Optional[float]:
+        """
+        Track GitHub's rate limit headers. When the budget is spent, close the gate until it resets.
+        Returns how long to wait before retrying a rate-limited response, or None if it shouldn't be retried.
+        """
+        headers = response.headers
+        wait = None
+        if headers.get('Retry-After', '').isdigit():
+            wait = float(headers['Retry-After'])
+        elif headers.get('X-RateLimit-Remaining') == '0' and headers.get('X-RateLimit-Reset', '').isdigit():
+            wait = max(int(headers['X-RateLimit-Reset']) - time.time(), 0) + 1
+        
+        if wait is None or wait > MAX_RATE_LIMIT_WAIT:
+            return None
+        
+        # Hold back every other request until the limit resets, not just this one
+        reopens = time.monotonic() + wait
+        if reopens > self._gate_reopens:
+            self._gate_reopens = reopens
+            self._gate.clear()
+            asyncio.get_running_loop().call_later(wait, self._reopen_gate)
+        
+        return wait if response.status_code in (403, 429) else None
+    
+    def _reopen_gate(self) -> None:
+        """Open the gate unless a later rate limit extended it"""
+        if time.monotonic() >= self._gate_reopens:
+            self._gate.set()
+    
+    async def request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Make API request to GitHub; identical GETs made while one is in flight share its response"""
+        url = endpoint if endpoint.startswith('http') else f"{self.api_base}{endpoint}"
+        if method != 'GET':
+            return await self._send(method, url, **kwargs)
+        
+        key = (url, _freeze(kwargs.get('params')), _freeze(kwargs.get('headers')))
+        task = self._inflight.get(key)
+        if task is None:
+            # The shared request runs in its own task, so it outlives any one caller
+            task = asyncio.ensure_future(self._send(method, url, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._request_done(key, done))
         
-        # Set default timeout if not specified
-        if 'timeout' not in kwargs:
-            kwargs['timeout'] = 30
+        # Shielded so a cancelled caller doesn't cancel the request for everyone else
+        return await asyncio.shield(task)
+    
+    def _request_done(self, key: Tuple, task: "asyncio.Task[httpx.Response]") -> None:
+        """Forget a finished in-flight GET"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark a failure as retrieved in case every caller was cancelled before it arrived
+        if not task.cancelled():
+            task.exception()
+    
+    async def _send(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Send one request, revalidating cached GETs and retrying rate-limited responses"""
+        # Merge per-call headers over the shared authentication headers
+        extra_headers = kwargs.pop('headers', None) or {}
+        headers = await self._get_headers()
+        if extra_headers:
+            headers = {**headers, **extra_headers}
+        
+        # Revalidate previously seen GET responses instead of refetching them
+        cache_key = None
+        cached = None
+        if method == 'GET':
+            cache_key = (url, _freeze(kwargs.get('params')), _freeze(extra_headers))
+            cached = self._etag_cache.get(cache_key)
+            if cached is not None:
+                headers = dict(headers)
+                if cached.headers.get('ETag'):
+                    headers['If-None-Match'] = cached.headers['ETag']
+                if cached.headers.get('Last-Modified'):
+                    headers['If-Modified-Since'] = cached.headers['Last-Modified']
             
-        try:
-            return requests.request(
-                method=method,
-                url=url,
-                headers=self._get_headers(),
-                **kwargs
-            )
-        except requests.exceptions.Timeout:
-            raise Exception("GitHub API request timed out")
-        except requests.exceptions.ConnectionError:
-            raise Exception("Failed to connect to GitHub API")
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            try:
+                limiter = await self._throttle()
+                async with limiter:
+                    response = await self.client.request(
+                        method=method,
+                        url=url,
+                        headers=headers,
+                        **kwargs
+                    )
+            except httpx.TimeoutException:
+                raise Exception("GitHub API request timed out")
+            except httpx.ConnectError:
+                raise Exception("Failed to connect to GitHub API")
+            
+            delay = self._rate_limit_delay(response)
+            if delay is None or attempt == RATE_LIMIT_RETRIES:
+                break
+            logger.warning("GitHub rate limit hit on %s %s; retrying in %.0fs", method, url, delay)
+            await asyncio.sleep(delay)
+        
+        if cache_key is not None:
+            if response.status_code == 304 and cached is not None:
+                self._etag_cache.move_to_end(cache_key)
+                return cached
+            if response.status_code == 200 and ('ETag' in response.headers or 'Last-Modified' in response.headers):
+                self._etag_cache[cache_key] = response
+                self._etag_cache.move_to_end(cache_key)
+                if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        
+        return response
+    
+    async def get_prefix(self, endpoint: str, limit: int, **kwargs) -> Tuple[httpx.Response, bytes]:
+        """
+        GET an endpoint but transfer at most limit bytes of the body, asking for only that range.
+        The body is streamed, so memory stays bounded even if the server ignores the Range header.
+        JSON bodies (e.g. directory listings) and error responses are read in full.
+        Rate-limited responses are retried like request() retries them.
+        The body is requested uncompressed so Content-Length still gives its size if Range is ignored.
+        """
+        url = endpoint if endpoint.startswith('http') else f"{self.api_base}{endpoint}"
+        headers = {**(await self._get_headers()), **(kwargs.pop('headers', None) or {}),
+                   'Range': f'bytes=0-{limit - 1}', 'Accept-Encoding': 'identity'}
+        
+        attempt = 0
+        while True:
+            try:
+                limiter = await self._throttle()
+                async with limiter, self.client.stream('GET', url, headers=headers, **kwargs) as response:
+                    delay = self._rate_limit_delay(response)
+                    if delay is None or attempt == RATE_LIMIT_RETRIES:
+                        return response, await self._read_prefix(response, limit)
+            except httpx.TimeoutException:
+                raise Exception("GitHub API request timed out")
+            except httpx.ConnectError:
+                raise Exception("Failed to connect to GitHub API")
+            
+            attempt += 1
+            logger.warning("GitHub rate limit hit on GET %s; retrying in %.0fs", url, delay)
+            await asyncio.sleep(delay)
+    
+    @staticmethod
+    async def _read_prefix(response: httpx.Response, limit: int) -> bytes:
+        """Read up to limit bytes of a streamed body; JSON and error bodies are read in full"""
+        if (response.status_code not in (200, 206)
+                or response.headers.get('Content-Type', '').startswith('application/json')):
+            await response.aread()
+            return response.content
+        
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) >= limit:
+                break
+        return bytes(body[:limit])
+    
+    async def cached_get(self, endpoint: str, shape: Callable[[Any], Any],
+                         errors: Optional[Dict[int, str]] = None,
+                         decode: Callable[[bytes], Any] = orjson.loads, **kwargs) -> Any:
+        """
+        GET an endpoint and return shape(decode(body)).
+        While GitHub answers 304 the earlier shaped value is reused, skipping JSON decoding and reshaping.
+        errors maps status codes to the message raised for them.
+        """
+        response = await self.request('GET', endpoint, **kwargs)
+        
+        if errors and response.status_code in errors:
+            raise Exception(errors[response.status_code])
+        elif response.status_code != 200:
+            response.raise_for_status()
+        
+        shaped = self._shaped.setdefault(response, {})
+        if shape not in shaped:
+            shaped[shape] = shape(decode(response.content))
+        return shaped[shape]
+    
+    async def close(self) -> None:
+        """Close pooled connections; call once when the server shuts down"""
+        await self.client.aclose()
+    
+    async def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None,
+                      allow_not_found: bool = False) -> Dict[str, Any]:
+        """
+        Run a GraphQL query and return its data.
+        With allow_not_found, NOT_FOUND errors are ignored and the fields they refer to are left null.
+        """
+        response = await self.request('POST', self.graphql_url, json={'query': query, 'variables': variables or {}})
+        
+        if response.status_code != 200:
+            response.raise_for_status()
+        
+        result = _parse(response)
+        errors = result.get('errors') or []
+        if allow_not_found:
+            errors = [error for error in errors if error.get('type') != 'NOT_FOUND']
+        if errors or result.get('data') is None:
+            messages = '; '.join(error.get('message', 'Unknown error') for error in result.get('errors') or [])
+            raise Exception(f"GitHub GraphQL error: {messages or 'no data returned'}")
+        
+        return result['data']
+    
+    async def graphql_nodes(self, query: str, variables: Dict[str, Any], connection: str,
+                            max_pages: int = 1, keep: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                            limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Collect the nodes of repository.<connection> across up to max_pages pages.
+        With keep, only the nodes it accepts are collected; paging stops once limit nodes are collected.
+        The query must take an $after cursor and select pageInfo on the connection.
+        """
+        variables = dict(variables)
+        nodes: List[Dict[str, Any]] = []
+        for _ in range(max_pages):
+            page = (await self.graphql(query, variables))['repository'][connection]
+            nodes.extend(filter(keep, page['nodes']) if keep else page['nodes'])
+            if not page['pageInfo']['hasNextPage'] or (limit is not None and len(nodes) >= limit):
+                break
+            variables['after'] = page['pageInfo']['endCursor']
+        return nodes[:limit]
+    
+    async def batch(self, calls: List[Awaitable[Any]]) -> List[Any]:
+        """
+        Run independent API calls concurrently, at most MAX_CONCURRENT_REQUESTS at a time.
+        Results come back in call order; failed calls yield their exception.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        
+        async def run(call: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await call
+        
+        return await asyncio.gather(*(run(call) for call in calls), return_exceptions=True)
+    
+    async def paginate(self, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                       max_pages: int = 1, decode: Callable[[bytes], Any] = orjson.loads) -> AsyncIterator[Any]:
+        """
+        Yield up to max_pages pages of a list endpoint, decoded with decode, in order.
+        Page numbers come from the Link header; once the last page is known the
+        following pages are fetched concurrently, a batch-sized window at a time.
+        """
+        params = dict(params or {})
+        response = await self.request('GET', endpoint, params=params)
+        if response.status_code != 200:
+            response.raise_for_status()
+        yield decode(response.content)
+        
+        page = 1
+        while page < max_pages:
+            links = _page_links(response)
+            if 'next' not in links:
+                break
+            
+            # Without a last page we can only follow rel="next" one page at a time
+            last = min(links.get('last', links['next']), max_pages)
+            window = range(links['next'], min(last, links['next'] + MAX_CONCURRENT_REQUESTS - 1) + 1)
+            responses = await self.batch([
+                self.request('GET', endpoint, params={**params, 'page': number})
+                for number in window
+            ])
+            
+            for response in responses:
+                if isinstance(response, BaseException):
+                    raise response
+                if response.status_code != 200:
+                    response.raise_for_status()
+                yield decode(response.content)
+            page = window[-1]
 
 # Create server instance
 server = Server(
@@ -185,358 +642,459 @@ server = Server(
 # Create GitHub client instance
 github = GitHubClient()
 
-@server.list_tools()
-async def handle_list_tools() -> List[types.Tool]:
-    """
-    List available tools.
-    Each tool specifies its arguments using JSON Schema.
-    """
-    return [
-        types.Tool(
-            name="get_repository_info",
-            description="Get information about the current GitHub repository",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "owner": {
-                        "type": "string",
-                        "description": "Repository owner (optional, uses env/git if not provided)"
-                    },
-                    "repo": {
-                        "type": "string", 
-                        "description": "Repository name (optional, uses env/git if not provided)"
-                    }
+# Repository metadata (info, languages, topics) rarely changes; serve repeats from memory
+_repo_cache = TTLCache(maxsize=256, ttl=300)
+
+# Default branch per (owner, repo) for create_pull_request; dropped when GitHub rejects it
+_default_branch_cache = TTLCache(maxsize=128, ttl=3600)
+
+# Tool definitions, built once at import time and shared by every list_tools call
+_TOOLS: List[types.Tool] = [
+    types.Tool(
+        name="get_repository_info",
+        description="Get information about the current GitHub repository",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "owner": {
+                    "type": "string",
+                    "description": "Repository owner (optional, uses env/git if not provided)"
                 },
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="list_issues",
-            description="List issues in a GitHub repository",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "state": {
-                        "type": "string",
-                        "enum": ["open", "closed", "all"],
-                        "description": "Filter by issue state",
-                        "default": "open"
-                    },
-                    "labels": {
-                        "type": "string",
-                        "description": "Comma-separated list of labels to filter by"
-                    },
-                    "per_page": {
-                        "type": "integer",
-                        "description": "Number of issues per page (max 100)",
-                        "default": 30,
-                        "minimum": 1,
-                        "maximum": 100
-                    }
+                "repo": {
+                    "type": "string", 
+                    "description": "Repository name (optional, uses env/git if not provided)"
+                }
+            },
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="list_issues",
+        description="List issues in a GitHub repository",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "state": {
+                    "type": "string",
+                    "enum": ["open", "closed", "all"],
+                    "description": "Filter by issue state",
+                    "default": "open"
                 },
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="create_issue",
-            description="Create a new issue in a GitHub repository",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Issue title"
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "Issue body/description"
-                    },
-                    "labels": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Labels to add to the issue"
-                    },
-                    "assignees": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Usernames to assign to the issue"
-                    }
+                "labels": {
+                    "type": "string",
+                    "description": "Comma-separated list of labels; issues must have all of them"
                 },
-                "required": ["title"],
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="get_pull_requests",
-            description="List pull requests in a GitHub repository",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "state": {
-                        "type": "string",
-                        "enum": ["open", "closed", "all"],
-                        "description": "Filter by PR state",
-                        "default": "open"
-                    },
-                    "sort": {
-                        "type": "string",
-                        "enum": ["created", "updated", "popularity", "long-running"],
-                        "description": "Sort order",
-                        "default": "created"
-                    },
-                    "direction": {
-                        "type": "string",
-                        "enum": ["asc", "desc"],
-                        "description": "Sort direction",
-                        "default": "desc"
-                    }
+                "per_page": {
+                    "type": "integer",
+                    "description": "Number of issues per page (max 100)",
+                    "default": 30,
+                    "minimum": 1,
+                    "maximum": 100
                 },
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="update_issue",
-            description="Update an existing GitHub issue",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_number": {
-                        "type": "integer",
-                        "description": "Issue number to update"
-                    },
-                    "title": {
-                        "type": "string",
-                        "description": "New issue title"
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "New issue body/description"
-                    },
-                    "state": {
-                        "type": "string",
-                        "enum": ["open", "closed"],
-                        "description": "Issue state"
-                    },
-                    "labels": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Labels to set on the issue"
-                    },
-                    "assignees": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Usernames to assign to the issue"
-                    }
+                "max_pages": {
+                    "type": "integer",
+                    "description": "Number of pages to fetch (max 10)",
+                    "default": 1,
+                    "minimum": 1,
+                    "maximum": 10
+                }
+            },
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="create_issue",
+        description="Create a new issue in a GitHub repository",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Issue title"
                 },
-                "required": ["issue_number"],
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="get_issue",
-            description="Get details of a specific GitHub issue",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_number": {
-                        "type": "integer",
-                        "description": "Issue number to retrieve"
-                    }
+                "body": {
+                    "type": "string",
+                    "description": "Issue body/description"
                 },
-                "required": ["issue_number"],
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="create_pull_request",
-            description="Create a new pull request",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": "Pull request title"
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "Pull request description"
-                    },
-                    "head": {
-                        "type": "string",
-                        "description": "Branch name containing changes"
-                    },
-                    "base": {
-                        "type": "string",
-                        "description": "Target branch (default: repository default branch)",
-                        "default": "main"
-                    },
-                    "draft": {
-                        "type": "boolean",
-                        "description": "Create as draft PR",
-                        "default": False
-                    }
+                "labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Labels to add to the issue"
                 },
-                "required": ["title", "head"],
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="get_pull_request",
-            description="Get details of a specific pull request",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "pr_number": {
-                        "type": "integer",
-                        "description": "Pull request number to retrieve"
-                    }
+                "assignees": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Usernames to assign to the issue"
+                }
+            },
+            "required": ["title"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="get_pull_requests",
+        description="List pull requests in a GitHub repository",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "state": {
+                    "type": "string",
+                    "enum": ["open", "closed", "all"],
+                    "description": "Filter by PR state",
+                    "default": "open"
                 },
-                "required": ["pr_number"],
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="list_branches",
-            description="List branches in a GitHub repository",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "protected": {
-                        "type": "boolean",
-                        "description": "Filter by protection status"
-                    },
-                    "per_page": {
-                        "type": "integer",
-                        "description": "Number of branches per page (max 100)",
-                        "default": 30,
-                        "minimum": 1,
-                        "maximum": 100
-                    }
+                "sort": {
+                    "type": "string",
+                    "enum": ["created", "updated", "popularity", "long-running"],
+                    "description": "Sort order",
+                    "default": "created"
                 },
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="get_commits",
-            description="List commits in a GitHub repository",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "sha": {
-                        "type": "string",
-                        "description": "Branch or commit SHA to start from"
-                    },
-                    "path": {
-                        "type": "string",
-                        "description": "Filter commits by file path"
-                    },
-                    "author": {
-                        "type": "string",
-                        "description": "Filter by commit author"
-                    },
-                    "since": {
-                        "type": "string",
-                        "description": "ISO 8601 date - only commits after this date"
-                    },
-                    "until": {
-                        "type": "string",
-                        "description": "ISO 8601 date - only commits before this date"
-                    },
-                    "per_page": {
-                        "type": "integer",
-                        "description": "Number of commits per page (max 100)",
-                        "default": 30,
-                        "minimum": 1,
-                        "maximum": 100
-                    }
+                "direction": {
+                    "type": "string",
+                    "enum": ["asc", "desc"],
+                    "description": "Sort direction",
+                    "default": "desc"
                 },
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="get_file_content",
-            description="Get content of a file from the repository",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "File path in the repository"
-                    },
-                    "ref": {
-                        "type": "string",
-                        "description": "Branch, tag, or commit SHA (default: default branch)"
-                    }
+                "max_pages": {
+                    "type": "integer",
+                    "description": "Number of pages to fetch (max 10)",
+                    "default": 1,
+                    "minimum": 1,
+                    "maximum": 10
+                }
+            },
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="update_issue",
+        description="Update an existing GitHub issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_number": {
+                    "type": "integer",
+                    "description": "Issue number to update"
                 },
-                "required": ["path"],
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="search_code",
-            description="Search for code in the repository",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "Search query"
-                    },
-                    "filename": {
-                        "type": "string",
-                        "description": "Filter by filename"
-                    },
-                    "extension": {
-                        "type": "string",
-                        "description": "Filter by file extension"
-                    },
-                    "path": {
-                        "type": "string",
-                        "description": "Filter by path"
-                    }
+                "title": {
+                    "type": "string",
+                    "description": "New issue title"
                 },
-                "required": ["query"],
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="add_issue_comment",
-            description="Add a comment to an issue",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_number": {
-                        "type": "integer",
-                        "description": "Issue number to comment on"
-                    },
-                    "body": {
-                        "type": "string",
-                        "description": "Comment body"
-                    }
+                "body": {
+                    "type": "string",
+                    "description": "New issue body/description"
                 },
-                "required": ["issue_number", "body"],
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="get_repository_languages",
-            description="Get programming languages used in the repository",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False
-            }
-        ),
-        types.Tool(
-            name="get_repository_topics",
-            description="Get topics/tags associated with the repository",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "additionalProperties": False
-            }
-        )
-    ]
+                "state": {
+                    "type": "string",
+                    "enum": ["open", "closed"],
+                    "description": "Issue state"
+                },
+                "labels": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Labels to set on the issue"
+                },
+                "assignees": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Usernames to assign to the issue"
+                }
+            },
+            "required": ["issue_number"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="get_issue",
+        description="Get details of a specific GitHub issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_number": {
+                    "type": "integer",
+                    "description": "Issue number to retrieve"
+                }
+            },
+            "required": ["issue_number"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="batch_get_issues",
+        description="Get details of several GitHub issues in one request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_numbers": {
+                    "type": "array",
+                    "items": {"type": "integer", "minimum": 1},
+                    "description": "Issue numbers to retrieve",
+                    "minItems": 1
+                }
+            },
+            "required": ["issue_numbers"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="create_pull_request",
+        description="Create a new pull request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": "Pull request title"
+                },
+                "body": {
+                    "type": "string",
+                    "description": "Pull request description"
+                },
+                "head": {
+                    "type": "string",
+                    "description": "Branch name containing changes"
+                },
+                "base": {
+                    "type": "string",
+                    "description": "Target branch (default: repository default branch)",
+                    "default": "main"
+                },
+                "draft": {
+                    "type": "boolean",
+                    "description": "Create as draft PR",
+                    "default": False
+                }
+            },
+            "required": ["title", "head"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="get_pull_request",
+        description="Get details of a specific pull request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "pr_number": {
+                    "type": "integer",
+                    "description": "Pull request number to retrieve"
+                }
+            },
+            "required": ["pr_number"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="list_branches",
+        description="List branches in a GitHub repository",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "protected": {
+                    "type": "boolean",
+                    "description": "Filter by protection status"
+                },
+                "per_page": {
+                    "type": "integer",
+                    "description": "Number of branches per page (max 100)",
+                    "default": 30,
+                    "minimum": 1,
+                    "maximum": 100
+                },
+                "max_pages": {
+                    "type": "integer",
+                    "description": "Number of pages to fetch (max 10); later pages are fetched concurrently",
+                    "default": 1,
+                    "minimum": 1,
+                    "maximum": 10
+                },
+                "all_pages": {
+                    "type": "boolean",
+                    "description": "Fetch every page (up to 100) instead of max_pages",
+                    "default": False
+                }
+            },
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="get_commits",
+        description="List commits in a GitHub repository",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "sha": {
+                    "type": "string",
+                    "description": "Branch or commit SHA to start from"
+                },
+                "path": {
+                    "type": "string",
+                    "description": "Filter commits by file path"
+                },
+                "author": {
+                    "type": "string",
+                    "description": "Filter by commit author"
+                },
+                "since": {
+                    "type": "string",
+                    "description": "ISO 8601 date - only commits after this date"
+                },
+                "until": {
+                    "type": "string",
+                    "description": "ISO 8601 date - only commits before this date"
+                },
+                "per_page": {
+                    "type": "integer",
+                    "description": "Number of commits per page (max 100)",
+                    "default": 30,
+                    "minimum": 1,
+                    "maximum": 100
+                },
+                "max_pages": {
+                    "type": "integer",
+                    "description": "Number of pages to fetch (max 10); later pages are fetched concurrently",
+                    "default": 1,
+                    "minimum": 1,
+                    "maximum": 10
+                },
+                "all_pages": {
+                    "type": "boolean",
+                    "description": "Fetch every page (up to 100) instead of max_pages",
+                    "default": False
+                }
+            },
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="get_file_content",
+        description="Get content of a file from the repository",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "path": {
+                    "type": "string",
+                    "description": "File path in the repository"
+                },
+                "ref": {
+                    "type": "string",
+                    "description": "Branch, tag, or commit SHA (default: default branch)"
+                }
+            },
+            "required": ["path"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="search_code",
+        description="Search for code in the repository",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query"
+                },
+                "filename": {
+                    "type": "string",
+                    "description": "Filter by filename"
+                },
+                "extension": {
+                    "type": "string",
+                    "description": "Filter by file extension"
+                },
+                "path": {
+                    "type": "string",
+                    "description": "Filter by path"
+                },
+                "per_page": {
+                    "type": "integer",
+                    "description": "Number of results per page (max 100)",
+                    "default": 30,
+                    "minimum": 1,
+                    "maximum": 100
+                },
+                "max_pages": {
+                    "type": "integer",
+                    "description": "Number of pages to fetch (max 10); later pages are fetched concurrently",
+                    "default": 1,
+                    "minimum": 1,
+                    "maximum": 10
+                },
+                "all_pages": {
+                    "type": "boolean",
+                    "description": "Fetch every page (GitHub returns at most 1000 results)",
+                    "default": False
+                }
+            },
+            "required": ["query"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="add_issue_comment",
+        description="Add a comment to an issue",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "issue_number": {
+                    "type": "integer",
+                    "description": "Issue number to comment on"
+                },
+                "body": {
+                    "type": "string",
+                    "description": "Comment body"
+                }
+            },
+            "required": ["issue_number", "body"],
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="get_repository_languages",
+        description="Get programming languages used in the repository",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="get_repository_topics",
+        description="Get topics/tags associated with the repository",
+        inputSchema={
+            "type": "object",
+            "properties": {},
+            "additionalProperties": False
+        }
+    ),
+    types.Tool(
+        name="get_repository_overview",
+        description="Get repository information, languages, topics, branches and recent commits in a single call",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "owner": {
+                    "type": "string",
+                    "description": "Repository owner (optional, uses env/git if not provided)"
+                },
+                "repo": {
+                    "type": "string",
+                    "description": "Repository name (optional, uses env/git if not provided)"
+                }
+            },
+            "additionalProperties": False
+        }
+    )
+]
+
+@server.list_tools()
+async def handle_list_tools() -> List[types.Tool]:
+    """
+    List available tools.
+    Each tool specifies its arguments using JSON Schema.
+    """
+    return _TOOLS
 
 @server.call_tool()
 async def handle_call_tool(
@@ -549,16 +1107,11 @@ async def handle_call_tool(
     """
     try:
         # Validate tool name first
-        valid_tools = [
-            "get_repository_info", "list_issues", "create_issue", "get_pull_requests",
-            "update_issue", "get_issue", "create_pull_request", "get_pull_request",
-            "list_branches", "get_commits", "get_file_content", "search_code",
-            "add_issue_comment", "get_repository_languages", "get_repository_topics"
-        ]
-        if name not in valid_tools:
+        handler = _TOOL_DISPATCH.get(name)
+        if handler is None:
             return [types.TextContent(
                 type="text",
-                text=f"Error: Unknown tool '{name}'. Available tools: {', '.join(valid_tools)}"
+                text=f"Error: Unknown tool '{name}'. Available tools: {', '.join(_TOOL_DISPATCH)}"
             )]
         
         # Determine repository owner and name
@@ -573,80 +1126,51 @@ async def handle_call_tool(
             )]
         
         # Check authentication
-        if not github.pat and not all([github.app_id, github.installation_id, github.private_key_path]):
+        if not github.is_authenticated:
             return [types.TextContent(
                 type="text",
                 text="Error: No GitHub authentication configured. Set GITHUB_PAT or configure GitHub App credentials."
             )]
         
         # Execute the appropriate tool
-        if name == "get_repository_info":
-            result = await get_repository_info(owner, repo)
-        elif name == "list_issues":
-            result = await list_issues(owner, repo, arguments)
-        elif name == "create_issue":
-            result = await create_issue(owner, repo, arguments)
-        elif name == "get_pull_requests":
-            result = await get_pull_requests(owner, repo, arguments)
-        elif name == "update_issue":
-            result = await update_issue(owner, repo, arguments)
-        elif name == "get_issue":
-            result = await get_issue(owner, repo, arguments)
-        elif name == "create_pull_request":
-            result = await create_pull_request(owner, repo, arguments)
-        elif name == "get_pull_request":
-            result = await get_pull_request(owner, repo, arguments)
-        elif name == "list_branches":
-            result = await list_branches(owner, repo, arguments)
-        elif name == "get_commits":
-            result = await get_commits(owner, repo, arguments)
-        elif name == "get_file_content":
-            result = await get_file_content(owner, repo, arguments)
-        elif name == "search_code":
-            result = await search_code(owner, repo, arguments)
-        elif name == "add_issue_comment":
-            result = await add_issue_comment(owner, repo, arguments)
-        elif name == "get_repository_languages":
-            result = await get_repository_languages(owner, repo)
-        elif name == "get_repository_topics":
-            result = await get_repository_topics(owner, repo)
+        result = await handler(owner, repo, arguments)
         
         # Return result as formatted JSON text
         return [types.TextContent(
             type="text",
-            text=json.dumps(result, indent=2, ensure_ascii=False)
+            text=orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
         )]
         
-    except requests.exceptions.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         error_msg = f"GitHub API error: {e}"
         if e.response is not None:
             try:
-                error_detail = e.response.json()
+                error_detail = _parse(e.response)
                 error_msg = f"GitHub API error: {error_detail.get('message', str(e))}"
             except:
                 pass
         logger.error(error_msg)
         return [types.TextContent(type="text", text=error_msg)]
+    
+    except (msgspec.DecodeError, orjson.JSONDecodeError) as e:
+        # ValueErrors too, but GitHub's payload is at fault, not the caller's input
+        error_msg = f"Unexpected response from GitHub: {e}"
+        logger.error(error_msg)
+        return [types.TextContent(type="text", text=error_msg)]
+    
+    except ValueError as e:
+        # Expected validation failures; a traceback adds nothing but cost
+        error_msg = f"Invalid input: {e}"
+        logger.warning("Tool '%s' rejected input: %s", name, e)
+        return [types.TextContent(type="text", text=error_msg)]
         
     except Exception as e:
         error_msg = f"Error executing tool '{name}': {str(e)}"
         logger.error(error_msg, exc_info=True)
         return [types.TextContent(type="text", text=error_msg)]
 
-async def get_repository_info(owner: str, repo: str) -> Dict[str, Any]:
-    """Get repository information"""
-    response = github.request('GET', f'/repos/{owner}/{repo}')
-    
-    if response.status_code == 404:
-        raise Exception(f"Repository '{owner}/{repo}' not found")
-    elif response.status_code == 403:
-        raise Exception("API rate limit exceeded or insufficient permissions")
-    elif response.status_code != 200:
-        response.raise_for_status()
-    
-    data = response.json()
-    
-    # Return cleaned repository information
+def _repository_summary(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return cleaned repository information"""
     return {
         "name": data["name"],
         "full_name": data["full_name"],
@@ -666,45 +1190,92 @@ async def get_repository_info(owner: str, repo: str) -> Dict[str, Any]:
         "license": data["license"]["name"] if data.get("license") else None
     }
 
+async def get_repository_info(owner: str, repo: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Get repository information"""
+    cached = _repo_cache.get(("info", owner, repo))
+    if cached is not None:
+        return cached
+    
+    result = await github.cached_get(f'/repos/{owner}/{repo}', _repository_summary, errors={
+        404: f"Repository '{owner}/{repo}' not found",
+        403: "API rate limit exceeded or insufficient permissions"
+    })
+    _repo_cache[("info", owner, repo)] = result
+    return result
+
+# Only the fields list_issues returns, instead of the ~40-field REST issue payload
+_LIST_ISSUES_QUERY = """
+query($owner: String!, $repo: String!, $first: Int!, $after: String, $states: [IssueState!], $labels: [String!]) {
+  repository(owner: $owner, name: $repo) {
+    issues(first: $first, after: $after, states: $states, labels: $labels,
+           orderBy: {field: CREATED_AT, direction: DESC}) {
+      nodes {
+        number title state url body createdAt updatedAt
+        author { login }
+        labels(first: 100) { nodes { name } }
+        comments { totalCount }
+      }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
 async def list_issues(owner: str, repo: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
     """List repository issues"""
-    query_params = {
-        "state": params.get("state", "open"),
-        "per_page": min(params.get("per_page", 30), 100)  # Enforce max limit
+    state = params.get("state", "open")
+    labels = [label.strip() for label in params["labels"].split(",")] if params.get("labels") else None
+    
+    per_page = min(params.get("per_page", 30), 100)  # Enforce max limit
+    max_pages = min(params.get("max_pages", 1), MAX_PAGES)
+    
+    variables = {
+        "owner": owner,
+        "repo": repo,
+        "first": per_page,
+        "states": None if state == "all" else [state.upper()],
+        "labels": labels
     }
     
-    if params.get("labels"):
-        query_params["labels"] = params["labels"]
-    
-    response = github.request('GET', f'/repos/{owner}/{repo}/issues', params=query_params)
-    
-    if response.status_code != 200:
-        response.raise_for_status()
-    
-    issues = response.json()
+    if labels and len(labels) > 1:
+        # GraphQL matches any of the labels while the REST filter required all of them.
+        # Filter here and keep reading full pages (up to MAX_PAGES of them) until there
+        # are as many matches as the requested REST pages would have held. Label names
+        # are case-insensitive on GitHub, so compare them casefolded
+        required_labels = {label.casefold() for label in labels}
+        variables["first"] = 100
+        issues = await github.graphql_nodes(
+            _LIST_ISSUES_QUERY, variables, "issues", MAX_PAGES,
+            keep=lambda issue: required_labels.issubset(label["name"].casefold()
+                                                        for label in issue["labels"]["nodes"]),
+            limit=per_page * max_pages
+        )
+    else:
+        issues = await github.graphql_nodes(_LIST_ISSUES_QUERY, variables, "issues", max_pages)
     
-    # Return cleaned issue data (exclude pull requests)
+    # Return cleaned issue data
     result = []
     for issue in issues:
-        # Skip pull requests (they appear in issues endpoint too)
-        if "pull_request" in issue:
-            continue
-            
         result.append({
             "number": issue["number"],
             "title": issue["title"],
-            "state": issue["state"],
-            "html_url": issue["html_url"],
-            "user": issue["user"]["login"],
-            "labels": [label["name"] for label in issue["labels"]],
-            "created_at": issue["created_at"],
-            "updated_at": issue["updated_at"],
-            "comments": issue["comments"],
-            "body": (issue["body"][:200] + "...") if issue.get("body") and len(issue["body"]) > 200 else issue.get("body", "")
+            "state": issue["state"].lower(),
+            "html_url": issue["url"],
+            "user": (issue["author"] or {}).get("login", "ghost"),
+            "labels": [label["name"] for label in issue["labels"]["nodes"]],
+            "created_at": issue["createdAt"],
+            "updated_at": issue["updatedAt"],
+            "comments": issue["comments"]["totalCount"],
+            "body": _truncate(issue["body"])
         })
     
     return result
 
+# Optional tool arguments passed through unchanged to the REST request body
+_CREATE_ISSUE_KEYS = ("labels", "assignees")
+_UPDATE_ISSUE_KEYS = ("title", "body", "state", "labels", "assignees")
+_CREATE_PULL_REQUEST_KEYS = ("body", "draft")
+
 async def create_issue(owner: str, repo: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """Create a new issue"""
     # Validate required fields
@@ -713,26 +1284,21 @@ async def create_issue(owner: str, repo: str, params: Dict[str, Any]) -> Dict[st
     
     data = {
         "title": params["title"],
-        "body": params.get("body", "")
+        "body": params.get("body", ""),
+        **_pick(params, _CREATE_ISSUE_KEYS)
     }
     
-    # Add optional fields
-    if params.get("labels"):
-        data["labels"] = params["labels"]
-    if params.get("assignees"):
-        data["assignees"] = params["assignees"]
-    
-    response = github.request('POST', f'/repos/{owner}/{repo}/issues', json=data)
+    response = await github.request('POST', f'/repos/{owner}/{repo}/issues', json=data)
     
     if response.status_code == 404:
         raise Exception(f"Repository '{owner}/{repo}' not found")
     elif response.status_code == 422:
-        error_data = response.json()
+        error_data = _parse(response)
         raise ValueError(f"Invalid issue data: {error_data.get('message', 'Unknown error')}")
     elif response.status_code != 201:
         response.raise_for_status()
     
-    issue = response.json()
+    issue = _parse(response)
     
     return {
         "number": issue["number"],
@@ -743,61 +1309,84 @@ async def create_issue(owner: str, repo: str, params: Dict[str, Any]) -> Dict[st
         "message": "Issue created successfully"
     }
 
+# Only the fields get_pull_requests returns, instead of the full REST pull request payload
+_LIST_PULL_REQUESTS_QUERY = """
+query($owner: String!, $repo: String!, $first: Int!, $after: String, $states: [PullRequestState!],
+      $orderBy: IssueOrder) {
+  repository(owner: $owner, name: $repo) {
+    pullRequests(first: $first, after: $after, states: $states, orderBy: $orderBy) {
+      nodes {
+        number title state url body createdAt updatedAt isDraft merged mergedAt
+        headRefName baseRefName
+        author { login }
+      }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+"""
+
+# REST sort names -> GraphQL IssueOrderField ("long-running" has no exact equivalent)
+_PULL_REQUEST_SORT_FIELDS = {
+    "created": "CREATED_AT",
+    "updated": "UPDATED_AT",
+    "popularity": "COMMENTS",
+    "long-running": "CREATED_AT"
+}
+
+# REST state filter -> GraphQL PullRequestState values (REST "closed" includes merged PRs)
+_PULL_REQUEST_STATES = {
+    "open": ["OPEN"],
+    "closed": ["CLOSED", "MERGED"],
+    "all": None
+}
+
 async def get_pull_requests(owner: str, repo: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
     """List pull requests"""
-    query_params = {
-        "state": params.get("state", "open"),
-        "sort": params.get("sort", "created"),
-        "direction": params.get("direction", "desc")
+    variables = {
+        "owner": owner,
+        "repo": repo,
+        "first": 30,
+        "states": _PULL_REQUEST_STATES[params.get("state", "open")],
+        "orderBy": {
+            "field": _PULL_REQUEST_SORT_FIELDS[params.get("sort", "created")],
+            "direction": params.get("direction", "desc").upper()
+        }
     }
     
-    response = github.request('GET', f'/repos/{owner}/{repo}/pulls', params=query_params)
-    
-    if response.status_code != 200:
-        response.raise_for_status()
-    
-    prs = response.json()
+    prs = await github.graphql_nodes(_LIST_PULL_REQUESTS_QUERY, variables, "pullRequests",
+                                     min(params.get("max_pages", 1), MAX_PAGES))
     
     return [{
         "number": pr["number"],
         "title": pr["title"],
-        "state": pr["state"],
-        "html_url": pr["html_url"],
-        "user": pr["user"]["login"],
-        "created_at": pr["created_at"],
-        "updated_at": pr["updated_at"],
-        "draft": pr.get("draft", False),
-        "merged": pr.get("merged", False),
-        "merged_at": pr.get("merged_at"),
-        "head": pr["head"]["ref"],
-        "base": pr["base"]["ref"],
-        "body": (pr["body"][:200] + "...") if pr.get("body") and len(pr["body"]) > 200 else pr.get("body", "")
+        "state": "open" if pr["state"] == "OPEN" else "closed",
+        "html_url": pr["url"],
+        "user": (pr["author"] or {}).get("login", "ghost"),
+        "created_at": pr["createdAt"],
+        "updated_at": pr["updatedAt"],
+        "draft": pr["isDraft"],
+        "merged": pr["merged"],
+        "merged_at": pr["mergedAt"],
+        "head": pr["headRefName"],
+        "base": pr["baseRefName"],
+        "body": _truncate(pr["body"])
     } for pr in prs]
 
 async def update_issue(owner: str, repo: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """Update an existing issue"""
     issue_number = params["issue_number"]
     
-    data = {}
-    if params.get("title"):
-        data["title"] = params["title"]
-    if params.get("body"):
-        data["body"] = params["body"]
-    if params.get("state"):
-        data["state"] = params["state"]
-    if params.get("labels"):
-        data["labels"] = params["labels"]
-    if params.get("assignees"):
-        data["assignees"] = params["assignees"]
+    data = _pick(params, _UPDATE_ISSUE_KEYS)
     
-    response = github.request('PATCH', f'/repos/{owner}/{repo}/issues/{issue_number}', json=data)
+    response = await github.request('PATCH', f'/repos/{owner}/{repo}/issues/{issue_number}', json=data)
     
     if response.status_code == 404:
         raise Exception(f"Issue #{issue_number} not found")
     elif response.status_code != 200:
         response.raise_for_status()
     
-    issue = response.json()
+    issue = _parse(response)
     
     return {
         "number": issue["number"],
@@ -808,62 +1397,156 @@ async def update_issue(owner: str, repo: str, params: Dict[str, Any]) -> Dict[st
         "message": "Issue updated successfully"
     }
 
+# Issues per batch_get_issues document, keeping each query well inside GitHub's node limits
+ISSUE_BATCH_SIZE = 50
+
+# Only the fields get_issue returns, instead of the ~40-field REST issue payload
+_ISSUE_SELECTION = """
+  number title state url body createdAt updatedAt
+  author { login }
+  labels(first: 100) { nodes { name } }
+  assignees(first: 100) { nodes { login } }
+  comments { totalCount }
+"""
+
+# Like the REST issues endpoint, issue lookups also resolve pull request numbers;
+# spread both fragments into issueOrPullRequest
+_ISSUE_FIELDS = (
+    "\nfragment IssueFields on Issue {" + _ISSUE_SELECTION + "}\n"
+    "fragment PullRequestIssueFields on PullRequest {" + _ISSUE_SELECTION + "}\n"
+)
+
+def _issue_node_details(issue: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a GraphQL issue node onto the fields get_issue returns"""
+    return {
+        "number": issue["number"],
+        "title": issue["title"],
+        "state": "open" if issue["state"] == "OPEN" else "closed",
+        "html_url": issue["url"],
+        "user": (issue["author"] or {}).get("login", "ghost"),
+        "labels": [label["name"] for label in issue["labels"]["nodes"]],
+        "assignees": [assignee["login"] for assignee in issue["assignees"]["nodes"]],
+        "created_at": issue["createdAt"],
+        "updated_at": issue["updatedAt"],
+        "comments": issue["comments"]["totalCount"],
+        "body": issue["body"]
+    }
+
+_GET_ISSUE_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    issueOrPullRequest(number: $number) { ...IssueFields ...PullRequestIssueFields }
+  }
+}
+""" + _ISSUE_FIELDS
+
 async def get_issue(owner: str, repo: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """Get details of a specific issue"""
     issue_number = params["issue_number"]
     
-    response = github.request('GET', f'/repos/{owner}/{repo}/issues/{issue_number}')
-    
-    if response.status_code == 404:
+    data = await github.graphql(_GET_ISSUE_QUERY, {"owner": owner, "repo": repo, "number": issue_number},
+                                allow_not_found=True)
+    if data["repository"] is None:
+        raise Exception(f"Repository '{owner}/{repo}' not found")
+    issue = data["repository"]["issueOrPullRequest"]
+    if not issue:
         raise Exception(f"Issue #{issue_number} not found")
-    elif response.status_code != 200:
-        response.raise_for_status()
     
-    issue = response.json()
+    return _issue_node_details(issue)
+
+def _batch_issues_query(numbers: List[int]) -> str:
+    """Build one query that fetches every issue under an issue<number> alias"""
+    fields = "\n".join(f"    issue{n}: issueOrPullRequest(number: {n}) {{ ...IssueFields ...PullRequestIssueFields }}"
+                       for n in numbers)
+    return ("query($owner: String!, $repo: String!) {\n"
+            "  repository(owner: $owner, name: $repo) {\n"
+            f"{fields}\n"
+            "  }\n"
+            "}\n" + _ISSUE_FIELDS)
+
+async def batch_get_issues(owner: str, repo: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Get details of several issues, up to ISSUE_BATCH_SIZE per GraphQL request"""
+    numbers = list(dict.fromkeys(int(n) for n in params["issue_numbers"]))
+    if not numbers:
+        raise ValueError("At least one issue number is required")
+    invalid = [n for n in numbers if n < 1]
+    if invalid:
+        raise ValueError(f"Invalid issue numbers: {', '.join(map(str, invalid))}")
+    
+    chunks = [numbers[i:i + ISSUE_BATCH_SIZE] for i in range(0, len(numbers), ISSUE_BATCH_SIZE)]
+    pages = await github.batch([
+        github.graphql(_batch_issues_query(chunk), {"owner": owner, "repo": repo}, allow_not_found=True)
+        for chunk in chunks
+    ])
     
-    return {
-        "number": issue["number"],
-        "title": issue["title"],
-        "state": issue["state"],
-        "html_url": issue["html_url"],
-        "user": issue["user"]["login"],
-        "labels": [label["name"] for label in issue["labels"]],
-        "assignees": [assignee["login"] for assignee in issue["assignees"]],
-        "created_at": issue["created_at"],
-        "updated_at": issue["updated_at"],
-        "comments": issue["comments"],
-        "body": issue["body"]
-    }
+    result = []
+    for chunk, page in zip(chunks, pages):
+        if isinstance(page, BaseException):
+            raise page
+        repository = page["repository"]
+        if repository is None:
+            raise Exception(f"Repository '{owner}/{repo}' not found")
+        for n in chunk:
+            issue = repository.get(f"issue{n}")
+            result.append(_issue_node_details(issue) if issue else {"number": n, "error": f"Issue #{n} not found"})
+    
+    return result
+
+_DEFAULT_BRANCH_QUERY = """
+query($owner: String!, $repo: String!) {
+  repository(owner: $owner, name: $repo) { defaultBranchRef { name } }
+}
+"""
+
+async def _default_branch(owner: str, repo: str) -> str:
+    """Look up a repository's default branch and remember it"""
+    data = await github.graphql(_DEFAULT_BRANCH_QUERY, {"owner": owner, "repo": repo})
+    branch = (data["repository"]["defaultBranchRef"] or {}).get("name", "main")
+    _default_branch_cache[(owner, repo)] = branch
+    return branch
+
+def _rejected_base(error_data: Dict[str, Any]) -> bool:
+    """Whether a 422 from the pulls endpoint was caused by the base branch"""
+    return any(isinstance(error, dict) and error.get("field") == "base"
+               for error in error_data.get("errors", []))
 
 async def create_pull_request(owner: str, repo: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """Create a new pull request"""
-    # Get repository info to determine default branch
-    repo_response = github.request('GET', f'/repos/{owner}/{repo}')
-    if repo_response.status_code == 200:
-        default_branch = repo_response.json().get("default_branch", "main")
-    else:
-        default_branch = "main"
+    base = params.get("base")
+    cached_base = False
+    if not base:
+        # Use the default branch we already know, else look it up before posting
+        base = _default_branch_cache.get((owner, repo))
+        if base is None:
+            info = _repo_cache.get(("info", owner, repo))
+            base = info["default_branch"] if info else None
+        cached_base = base is not None
+        if base is None:
+            base = await _default_branch(owner, repo)
     
     data = {
         "title": params["title"],
         "head": params["head"],
-        "base": params.get("base", default_branch)
+        "base": base,
+        **_pick(params, _CREATE_PULL_REQUEST_KEYS)
     }
     
-    if params.get("body"):
-        data["body"] = params["body"]
-    if params.get("draft"):
-        data["draft"] = params["draft"]
+    response = await github.request('POST', f'/repos/{owner}/{repo}/pulls', json=data)
     
-    response = github.request('POST', f'/repos/{owner}/{repo}/pulls', json=data)
+    if response.status_code == 422 and cached_base and _rejected_base(_parse(response)):
+        # The cached default branch is stale (e.g. it was renamed); refresh it and retry once
+        _default_branch_cache.pop((owner, repo))
+        data["base"] = await _default_branch(owner, repo)
+        if data["base"] != base:
+            response = await github.request('POST', f'/repos/{owner}/{repo}/pulls', json=data)
     
     if response.status_code == 422:
-        error_data = response.json()
+        error_data = _parse(response)
         raise ValueError(f"Invalid pull request data: {error_data.get('message', 'Unknown error')}")
     elif response.status_code != 201:
         response.raise_for_status()
     
-    pr = response.json()
+    pr = _parse(response)
     
     return {
         "number": pr["number"],
@@ -877,136 +1560,218 @@ async def create_pull_request(owner: str, repo: str, params: Dict[str, Any]) ->
         "message": "Pull request created successfully"
     }
 
+# Only the fields get_pull_request returns
+_GET_PULL_REQUEST_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      number title state url body isDraft merged mergeable
+      createdAt updatedAt mergedAt
+      author { login }
+      headRefName headRefOid baseRefName baseRefOid
+    }
+  }
+}
+"""
+
+# GraphQL MergeableState back to the REST boolean (None while GitHub is still computing it)
+_MERGEABLE = {"MERGEABLE": True, "CONFLICTING": False}
+
 async def get_pull_request(owner: str, repo: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """Get details of a specific pull request"""
     pr_number = params["pr_number"]
     
-    response = github.request('GET', f'/repos/{owner}/{repo}/pulls/{pr_number}')
-    
-    if response.status_code == 404:
+    data = await github.graphql(_GET_PULL_REQUEST_QUERY, {"owner": owner, "repo": repo, "number": pr_number},
+                                allow_not_found=True)
+    if data["repository"] is None:
+        raise Exception(f"Repository '{owner}/{repo}' not found")
+    pr = data["repository"]["pullRequest"]
+    if not pr:
         raise Exception(f"Pull request #{pr_number} not found")
-    elif response.status_code != 200:
-        response.raise_for_status()
-    
-    pr = response.json()
     
     return {
         "number": pr["number"],
         "title": pr["title"],
-        "state": pr["state"],
-        "html_url": pr["html_url"],
-        "user": pr["user"]["login"],
-        "draft": pr.get("draft", False),
-        "merged": pr.get("merged", False),
-        "mergeable": pr.get("mergeable"),
+        "state": "open" if pr["state"] == "OPEN" else "closed",
+        "html_url": pr["url"],
+        "user": (pr["author"] or {}).get("login", "ghost"),
+        "draft": pr["isDraft"],
+        "merged": pr["merged"],
+        "mergeable": _MERGEABLE.get(pr["mergeable"]),
         "head": {
-            "ref": pr["head"]["ref"],
-            "sha": pr["head"]["sha"]
+            "ref": pr["headRefName"],
+            "sha": pr["headRefOid"]
         },
         "base": {
-            "ref": pr["base"]["ref"],
-            "sha": pr["base"]["sha"]
+            "ref": pr["baseRefName"],
+            "sha": pr["baseRefOid"]
         },
-        "created_at": pr["created_at"],
-        "updated_at": pr["updated_at"],
-        "merged_at": pr.get("merged_at"),
+        "created_at": pr["createdAt"],
+        "updated_at": pr["updatedAt"],
+        "merged_at": pr["mergedAt"],
         "body": pr["body"]
     }
 
+# Query defaults and accepted filters for the REST list tools
+_LIST_BRANCHES_DEFAULTS = MappingProxyType({"per_page": 30})
+_LIST_BRANCHES_PARAMS = frozenset({"per_page", "protected"})
+_GET_COMMITS_DEFAULTS = MappingProxyType({"per_page": 30})
+_GET_COMMITS_PARAMS = frozenset({"per_page", "sha", "path", "author", "since", "until"})
+_GET_FILE_CONTENT_DEFAULTS = MappingProxyType({})
+_GET_FILE_CONTENT_PARAMS = frozenset({"ref"})
+_SEARCH_CODE_DEFAULTS = MappingProxyType({"per_page": 30})
+_SEARCH_CODE_PARAMS = frozenset({"per_page"})
+
+# Per-call headers that never change, built once
+_RAW_HEADERS = MappingProxyType({'Accept': 'application/vnd.github.raw'})
+
+# Git's object ID for an empty blob, the SHA of every empty file
+_EMPTY_BLOB_SHA = "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+
+# Typed views of the REST list payloads: msgspec decodes just these fields
+# and skips everything else GitHub sends, instead of building dicts for it
+class _BranchCommit(msgspec.Struct):
+    sha: str
+    url: str
+
+class _Branch(msgspec.Struct):
+    name: str
+    commit: _BranchCommit
+    protected: bool = False
+
+class _Signature(msgspec.Struct):
+    name: Optional[str] = None
+    email: Optional[str] = None
+    date: Optional[str] = None
+
+class _CommitDetails(msgspec.Struct):
+    message: str
+    author: _Signature
+    committer: _Signature
+
+class _Commit(msgspec.Struct):
+    sha: str
+    commit: _CommitDetails
+    html_url: str
+    stats: Dict[str, int] = {}
+    files: List[msgspec.Raw] = []
+
+_decode_branches = msgspec.json.Decoder(List[_Branch]).decode
+_decode_commits = msgspec.json.Decoder(List[_Commit]).decode
+
+def _branch_summary(branch: _Branch) -> Dict[str, Any]:
+    """Project a branch onto the fields list_branches returns"""
+    return {
+        "name": branch.name,
+        "commit": {
+            "sha": branch.commit.sha,
+            "url": branch.commit.url
+        },
+        "protected": branch.protected
+    }
+
+def _commit_summary(commit: _Commit) -> Dict[str, Any]:
+    """Project a commit onto the fields get_commits returns"""
+    details = commit.commit
+    return {
+        "sha": commit.sha,
+        "message": details.message,
+        "author": {
+            "name": details.author.name,
+            "email": details.author.email,
+            "date": details.author.date
+        },
+        "committer": {
+            "name": details.committer.name,
+            "email": details.committer.email,
+            "date": details.committer.date
+        },
+        "html_url": commit.html_url,
+        "stats": commit.stats,
+        "files": len(commit.files)
+    }
+
 async def list_branches(owner: str, repo: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
     """List repository branches"""
-    query_params = {
-        "per_page": min(params.get("per_page", 30), 100)
-    }
+    query_params = _query_params(params, _LIST_BRANCHES_DEFAULTS, _LIST_BRANCHES_PARAMS)
     
-    if params.get("protected") is not None:
-        query_params["protected"] = params["protected"]
+    # Project each page as it arrives so the raw REST objects can be freed
+    branches = []
+    async for page in github.paginate(f'/repos/{owner}/{repo}/branches', query_params,
+                                      _page_limit(params), decode=_decode_branches):
+        branches.extend(map(_branch_summary, page))
     
-    response = github.request('GET', f'/repos/{owner}/{repo}/branches', params=query_params)
-    
-    if response.status_code != 200:
-        response.raise_for_status()
-    
-    branches = response.json()
-    
-    return [{
-        "name": branch["name"],
-        "commit": {
-            "sha": branch["commit"]["sha"],
-            "url": branch["commit"]["url"]
-        },
-        "protected": branch.get("protected", False)
-    } for branch in branches]
+    return branches
 
 async def get_commits(owner: str, repo: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
     """List repository commits"""
-    query_params = {
-        "per_page": min(params.get("per_page", 30), 100)
-    }
+    query_params = _query_params(params, _GET_COMMITS_DEFAULTS, _GET_COMMITS_PARAMS)
     
-    # Add optional filters
-    for param in ["sha", "path", "author", "since", "until"]:
-        if params.get(param):
-            query_params[param] = params[param]
-    
-    response = github.request('GET', f'/repos/{owner}/{repo}/commits', params=query_params)
-    
-    if response.status_code != 200:
-        response.raise_for_status()
+    commits = []
+    async for page in github.paginate(f'/repos/{owner}/{repo}/commits', query_params,
+                                      _page_limit(params), decode=_decode_commits):
+        commits.extend(map(_commit_summary, page))
     
-    commits = response.json()
-    
-    return [{
-        "sha": commit["sha"],
-        "message": commit["commit"]["message"],
-        "author": {
-            "name": commit["commit"]["author"]["name"],
-            "email": commit["commit"]["author"]["email"],
-            "date": commit["commit"]["author"]["date"]
-        },
-        "committer": {
-            "name": commit["commit"]["committer"]["name"],
-            "email": commit["commit"]["committer"]["email"],
-            "date": commit["commit"]["committer"]["date"]
-        },
-        "html_url": commit["html_url"],
-        "stats": commit.get("stats", {}),
-        "files": len(commit.get("files", []))
-    } for commit in commits]
+    return commits
+
+def _raw_file_entry(owner: str, repo: str, path: str, ref: Optional[str], size: Optional[int],
+                    sha: Optional[str], content: str) -> Dict[str, Any]:
+    """Build get_file_content's file entry for a raw response, which has no links of its own"""
+    location = f"{quote(ref or 'HEAD')}/{quote(path)}"
+    return {
+        "type": "file",
+        "name": path.rsplit('/', 1)[-1],
+        "path": path,
+        "size": size,
+        "sha": sha,
+        "html_url": f"{github.web_base}/{owner}/{repo}/blob/{location}",
+        "download_url": f"{github.web_base}/{owner}/{repo}/raw/{location}",
+        "content": content
+    }
 
 async def get_file_content(owner: str, repo: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """Get content of a file from the repository"""
     path = params["path"]
-    query_params = {}
-    
-    if params.get("ref"):
-        query_params["ref"] = params["ref"]
+    query_params = _query_params(params, _GET_FILE_CONTENT_DEFAULTS, _GET_FILE_CONTENT_PARAMS)
     
-    response = github.request('GET', f'/repos/{owner}/{repo}/contents/{path}', params=query_params)
+    # Ask for the raw media type so files arrive as plain bytes instead of base64 JSON,
+    # and only for the bytes the preview can show; a single byte is enough to size a binary file
+    binary = os.path.splitext(path)[1].lower() in _BINARY_EXTENSIONS
+    limit = 1 if binary else FILE_PREVIEW_BYTES
+    response, raw = await github.get_prefix(f'/repos/{owner}/{repo}/contents/{path}', limit,
+                                            params=query_params, headers=_RAW_HEADERS)
     
     if response.status_code == 404:
         raise Exception(f"File '{path}' not found")
-    elif response.status_code != 200:
+    elif response.status_code == 416:
+        # An empty file has no byte range to return; its body is an API error, not content
+        return _raw_file_entry(owner, repo, path, query_params.get('ref'), 0, _EMPTY_BLOB_SHA, "")
+    elif response.status_code not in (200, 206):
         response.raise_for_status()
     
-    file_data = response.json()
-    
-    # Handle directory vs file
-    if isinstance(file_data, list):
-        # It's a directory
-        return {
-            "type": "directory",
-            "path": path,
-            "contents": [{
-                "name": item["name"],
-                "type": item["type"],
-                "size": item.get("size"),
-                "html_url": item["html_url"]
-            } for item in file_data]
-        }
-    else:
-        # It's a file
-        import base64
+    # Handle directory vs file; directories, submodules and symlinks are still returned as JSON
+    if response.headers.get('Content-Type', '').startswith('application/json'):
+        # A range of JSON is useless; fetch it whole
+        if response.status_code == 206:
+            response = await github.request('GET', f'/repos/{owner}/{repo}/contents/{path}', params=query_params)
+            if response.status_code != 200:
+                response.raise_for_status()
+        file_data = _parse(response)
+        
+        if isinstance(file_data, list):
+            # It's a directory
+            return {
+                "type": "directory",
+                "path": path,
+                "contents": [{
+                    "name": item["name"],
+                    "type": item["type"],
+                    "size": item.get("size"),
+                    "html_url": item["html_url"]
+                } for item in file_data]
+            }
+        
+        # It's a submodule or symlink, described by its contents metadata
         content = ""
         if file_data.get("content"):
             try:
@@ -1020,10 +1785,63 @@ async def get_file_content(owner: str, repo: str, params: Dict[str, Any]) -> Dic
             "path": file_data["path"],
             "size": file_data["size"],
             "sha": file_data["sha"],
-            "html_url": file_data["html_url"],
+            "html_url": file_data.get("html_url"),
             "download_url": file_data.get("download_url"),
-            "content": content[:2000] + "..." if len(content) > 2000 else content
+            "content": content[:FILE_PREVIEW_CHARS] + "..." if len(content) > FILE_PREVIEW_CHARS else content
         }
+    else:
+        # It's a file; the full size comes from Content-Range when only a prefix was sent
+        content_range = response.headers.get('Content-Range', '')
+        if response.status_code == 206 and '/' in content_range and content_range.rsplit('/', 1)[1].isdigit():
+            size = int(content_range.rsplit('/', 1)[1])
+        elif len(raw) < limit:
+            size = len(raw)
+        else:
+            # Content-Length is only the file size when the body wasn't compressed in transit
+            uncompressed = 'Content-Length' in response.headers and 'Content-Encoding' not in response.headers
+            size = int(response.headers['Content-Length']) if uncompressed else None
+        truncated = size is None or size > len(raw)
+        
+        # Like git, treat a NUL byte in the first 8000 bytes as binary. A cut-off multi-byte
+        # character at the end of the prefix is held back rather than replaced
+        if binary or b'\0' in raw:
+            content = "[Binary file - content not displayable]"
+        else:
+            content = codecs.getincrementaldecoder('utf-8')('replace').decode(raw, final=not truncated)
+            if truncated or len(content) > FILE_PREVIEW_CHARS:
+                content = content[:FILE_PREVIEW_CHARS] + "..."
+        
+        # The raw response carries the blob SHA as its ETag
+        etag = response.headers.get('ETag', '').replace('W/', '').strip('"')
+        
+        return _raw_file_entry(owner, repo, path, query_params.get('ref'), size,
+                               etag if re.fullmatch(r'[0-9a-f]{40}', etag) else None, content)
+
+class _SearchItem(msgspec.Struct):
+    name: str
+    path: str
+    sha: str
+    html_url: str
+    score: float
+
+class _SearchResults(msgspec.Struct):
+    total_count: int
+    items: List[_SearchItem] = []
+
+_decode_search_results = msgspec.json.Decoder(_SearchResults).decode
+
+def _search_results(results: _SearchResults) -> Dict[str, Any]:
+    """Project code search results onto the fields search_code returns"""
+    return {
+        "total_count": results.total_count,
+        "items": [{
+            "name": item.name,
+            "path": item.path,
+            "sha": item.sha,
+            "html_url": item.html_url,
+            "score": item.score
+        } for item in results.items]
+    }
 
 async def search_code(owner: str, repo: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """Search for code in the repository"""
@@ -1037,23 +1855,20 @@ async def search_code(owner: str, repo: str, params: Dict[str, Any]) -> Dict[str
     if params.get("path"):
         query += f" path:{params['path']}"
     
-    response = github.request('GET', '/search/code', params={"q": query})
-    
-    if response.status_code != 200:
-        response.raise_for_status()
+    query_params = _query_params(params, _SEARCH_CODE_DEFAULTS, _SEARCH_CODE_PARAMS)
+    query_params["q"] = query
+    max_pages = _page_limit(params)
+    if max_pages == 1:
+        return await github.cached_get('/search/code', _search_results, decode=_decode_search_results,
+                                       params=query_params)
     
-    results = response.json()
+    result = {"total_count": 0, "items": []}
+    async for page in github.paginate('/search/code', query_params, max_pages, decode=_decode_search_results):
+        page_results = _search_results(page)
+        result["total_count"] = page_results["total_count"]
+        result["items"].extend(page_results["items"])
     
-    return {
-        "total_count": results["total_count"],
-        "items": [{
-            "name": item["name"],
-            "path": item["path"],
-            "sha": item["sha"],
-            "html_url": item["html_url"],
-            "score": item["score"]
-        } for item in results.get("items", [])]
-    }
+    return result
 
 async def add_issue_comment(owner: str, repo: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """Add a comment to an issue"""
@@ -1063,14 +1878,14 @@ async def add_issue_comment(owner: str, repo: str, params: Dict[str, Any]) -> Di
         "body": params["body"]
     }
     
-    response = github.request('POST', f'/repos/{owner}/{repo}/issues/{issue_number}/comments', json=data)
+    response = await github.request('POST', f'/repos/{owner}/{repo}/issues/{issue_number}/comments', json=data)
     
     if response.status_code == 404:
         raise Exception(f"Issue #{issue_number} not found")
     elif response.status_code != 201:
         response.raise_for_status()
     
-    comment = response.json()
+    comment = _parse(response)
     
     return {
         "id": comment["id"],
@@ -1081,16 +1896,8 @@ async def add_issue_comment(owner: str, repo: str, params: Dict[str, Any]) -> Di
         "message": "Comment added successfully"
     }
 
-async def get_repository_languages(owner: str, repo: str) -> Dict[str, int]:
-    """Get programming languages used in the repository"""
-    response = github.request('GET', f'/repos/{owner}/{repo}/languages')
-    
-    if response.status_code != 200:
-        response.raise_for_status()
-    
-    languages = response.json()
-    
-    # Calculate percentages
+def _language_breakdown(languages: Dict[str, int]) -> Dict[str, Any]:
+    """Turn per-language byte counts into bytes and percentages"""
     total_bytes = sum(languages.values())
     if total_bytes > 0:
         return {
@@ -1106,38 +1913,100 @@ async def get_repository_languages(owner: str, repo: str) -> Dict[str, int]:
     else:
         return {"languages": {}, "total_bytes": 0}
 
-async def get_repository_topics(owner: str, repo: str) -> Dict[str, List[str]]:
-    """Get topics/tags associated with the repository"""
-    response = github.request('GET', f'/repos/{owner}/{repo}/topics', 
-                             headers={**github._get_headers(), 'Accept': 'application/vnd.github.mercy-preview+json'})
-    
-    if response.status_code != 200:
-        response.raise_for_status()
-    
-    topics_data = response.json()
+async def get_repository_languages(owner: str, repo: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, int]:
+    """Get programming languages used in the repository"""
+    cached = _repo_cache.get(("languages", owner, repo))
+    if cached is not None:
+        return cached
     
+    result = await github.cached_get(f'/repos/{owner}/{repo}/languages', _language_breakdown)
+    _repo_cache[("languages", owner, repo)] = result
+    return result
+
+def _topic_list(topics_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the topic names and their count"""
     return {
         "topics": topics_data.get("names", []),
         "count": len(topics_data.get("names", []))
     }
 
+async def get_repository_topics(owner: str, repo: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, List[str]]:
+    """Get topics/tags associated with the repository"""
+    cached = _repo_cache.get(("topics", owner, repo))
+    if cached is not None:
+        return cached
+    
+    result = await github.cached_get(f'/repos/{owner}/{repo}/topics', _topic_list)
+    _repo_cache[("topics", owner, repo)] = result
+    return result
+
+# get_repository_overview shows the latest few commits, not a full page
+_OVERVIEW_COMMITS = MappingProxyType({"per_page": 10})
+
+async def get_repository_overview(owner: str, repo: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Get repository info, languages, topics, branches and recent commits, fetched concurrently"""
+    results = await github.batch([
+        get_repository_info(owner, repo),
+        get_repository_languages(owner, repo),
+        get_repository_topics(owner, repo),
+        list_branches(owner, repo, {}),
+        get_commits(owner, repo, _OVERVIEW_COMMITS)
+    ])
+    
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    
+    info, languages, topics, branches, commits = results
+    return {
+        "repository": info,
+        "languages": languages,
+        "topics": topics,
+        "branches": branches,
+        "recent_commits": commits
+    }
+
+# Tool name -> handler; every handler takes (owner, repo, arguments)
+_TOOL_DISPATCH: Dict[str, Callable[[str, str, Dict[str, Any]], Awaitable[Any]]] = {
+    "get_repository_info": get_repository_info,
+    "list_issues": list_issues,
+    "create_issue": create_issue,
+    "get_pull_requests": get_pull_requests,
+    "update_issue": update_issue,
+    "get_issue": get_issue,
+    "batch_get_issues": batch_get_issues,
+    "create_pull_request": create_pull_request,
+    "get_pull_request": get_pull_request,
+    "list_branches": list_branches,
+    "get_commits": get_commits,
+    "get_file_content": get_file_content,
+    "search_code": search_code,
+    "add_issue_comment": add_issue_comment,
+    "get_repository_languages": get_repository_languages,
+    "get_repository_topics": get_repository_topics,
+    "get_repository_overview": get_repository_overview,
+}
+
 async def main():
     """Main entry point for the MCP server"""
     # Run the server using stdio transport
-    async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="feather-code",
-                server_version="1.0.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={}
+    try:
+        async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="feather-code",
+                    server_version="1.0.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={}
+                    )
                 )
             )
-        )
+    finally:
+        # Release pooled sockets so supervised restarts don't leak connections
+        await github.close()
 
 if __name__ == "__main__":
-    import asyncio
     asyncio.run(main())
\ No newline at end of file
@@ -43,7 +43,7 @@ if %errorlevel% neq 0 (
 REM Install dependencies
 echo.
 echo 📚 Installing dependencies...
-set REQUIREMENTS=mcp>=1.0.0 PyJWT>=2.8.0 requests>=2.31.0 cryptography>=41.0.0
+set REQUIREMENTS=mcp>=1.0.0 httpx[http2]>=0.24.0 msgspec>=0.18.0 orjson>=3.9.0 cryptography>=41.0.0
 
 for %%r in (%REQUIREMENTS%) do (
     echo Installing %%r...
@@ -70,8 +70,9 @@ fi
 echo -e "\n📚 Installing dependencies..."
 REQUIREMENTS=(
     "mcp>=1.0.0"
-    "PyJWT>=2.8.0"
-    "requests>=2.31.0"
+    "httpx[http2]>=0.24.0"
+    "msgspec>=0.18.0"
+    "orjson>=3.9.0"
     "cryptography>=41.0.0"
 )
 
@@ -102,7 +103,7 @@ if [[ "$OS" == "linux" ]]; then
                     ;;
                 3)
                     print_info "Please install dependencies manually using your system package manager"
-                    print_info "Example for Arch: sudo pacman -S python-requests python-cryptography"
+                    print_info "Example for Arch: sudo pacman -S python-httpx python-cryptography"
                     exit 0
                     ;;
                 *)
@@ -0,0 +1,37 @@
+"""Shared fixtures: a fixed GitHub configuration and clients answered by an in-process mock transport"""
+
+import httpx
+import pytest
+
+import feather_code
+
+
+@pytest.fixture(autouse=True)
+def github_env(monkeypatch):
+    """Configure clients for octo/demo with a PAT, whatever the surrounding environment holds"""
+    monkeypatch.setenv('GITHUB_OWNER', 'octo')
+    monkeypatch.setenv('GITHUB_REPO', 'demo')
+    monkeypatch.setenv('GITHUB_PAT', 'test-token')
+    for name in ('GITHUB_API_URL', 'GITHUB_PAT_FILE', 'GITHUB_APP_ID',
+                 'GITHUB_INSTALLATION_ID', 'GITHUB_PRIVATE_KEY_PATH'):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture
+def mock_client():
+    """Factory for GitHubClients whose requests are answered by handler instead of the network"""
+    def make(handler) -> feather_code.GitHubClient:
+        client = feather_code.GitHubClient()
+        client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+    return make
+
+
+@pytest.fixture
+def github(monkeypatch, mock_client):
+    """Point the module's GitHub client at a mock transport; set .handler to answer requests"""
+    client = mock_client(lambda request: client.handler(request))
+    monkeypatch.setattr(feather_code, "github", client)
+    monkeypatch.setattr(feather_code, "_repo_cache", feather_code.TTLCache(maxsize=256, ttl=300))
+    monkeypatch.setattr(feather_code, "_default_branch_cache", feather_code.TTLCache(maxsize=128, ttl=3600))
+    return client
@@ -0,0 +1,216 @@
+"""Tests for GitHubClient request handling, run against an in-process mock transport"""
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+import feather_code
+
+
+async def test_identical_gets_share_one_request(mock_client):
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"Python": 100})
+
+    client = mock_client(handler)
+    responses = await asyncio.gather(*(client.request('GET', '/repos/octo/demo/languages') for _ in range(5)))
+
+    assert len(calls) == 1
+    assert all(response is responses[0] for response in responses)
+    assert client._inflight == {}
+
+
+async def test_cancelled_caller_does_not_cancel_joined_callers(mock_client):
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"names": ["mcp"]})
+
+    client = mock_client(handler)
+    first = asyncio.ensure_future(client.request('GET', '/repos/octo/demo/topics'))
+    await asyncio.sleep(0.01)
+    second = asyncio.ensure_future(client.request('GET', '/repos/octo/demo/topics'))
+    await asyncio.sleep(0.01)
+    first.cancel()
+
+    response = await second
+
+    assert response.status_code == 200
+    assert len(calls) == 1
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+
+async def test_rate_limited_request_is_retried(mock_client):
+    statuses = iter([403, 429, 200])
+
+    def handler(request):
+        status = next(statuses)
+        return httpx.Response(status, json={}, headers={"Retry-After": "0"} if status != 200 else {})
+
+    client = mock_client(handler)
+    response = await client.request('GET', '/repos/octo/demo')
+
+    assert response.status_code == 200
+
+
+async def test_rate_limit_without_retry_after_is_not_retried(mock_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(403, json={"message": "Resource not accessible by integration"})
+
+    client = mock_client(handler)
+    response = await client.request('GET', '/repos/octo/demo')
+
+    assert response.status_code == 403
+    assert len(calls) == 1
+
+
+async def test_paginate_follows_link_header_to_last_page(mock_client):
+    def handler(request):
+        page = int(request.url.params.get('page', '1'))
+        links = ['<https://api.github.com/repos/octo/demo/branches?page=7>; rel="last"']
+        if page < 7:
+            links.append(f'<https://api.github.com/repos/octo/demo/branches?page={page + 1}>; rel="next"')
+        return httpx.Response(200, json=[{"name": f"b{page}"}], headers={"Link": ", ".join(links)})
+
+    client = mock_client(handler)
+    pages = [page async for page in client.paginate('/repos/octo/demo/branches', max_pages=10)]
+
+    assert [page[0]["name"] for page in pages] == [f"b{n}" for n in range(1, 8)]
+
+
+async def test_paginate_stops_at_max_pages(mock_client):
+    requested = []
+
+    def handler(request):
+        page = int(request.url.params.get('page', '1'))
+        requested.append(page)
+        links = [
+            f'<https://api.github.com/repos/octo/demo/commits?page={page + 1}>; rel="next"',
+            '<https://api.github.com/repos/octo/demo/commits?page=50>; rel="last"'
+        ]
+        return httpx.Response(200, json=[page], headers={"Link": ", ".join(links)})
+
+    client = mock_client(handler)
+    pages = [page async for page in client.paginate('/repos/octo/demo/commits', max_pages=3)]
+
+    assert pages == [[1], [2], [3]]
+    assert sorted(requested) == [1, 2, 3]
+
+
+async def test_graphql_tolerates_only_not_found_errors(mock_client):
+    def handler(request):
+        number = orjson.loads(request.content)["variables"]["number"]
+        error_type = "NOT_FOUND" if number == 1 else "FORBIDDEN"
+        return httpx.Response(200, json={
+            "data": {"repository": {"issueOrPullRequest": None}},
+            "errors": [{"type": error_type, "message": f"{error_type} error"}]
+        })
+
+    client = mock_client(handler)
+    data = await client.graphql("query", {"number": 1}, allow_not_found=True)
+    assert data["repository"]["issueOrPullRequest"] is None
+
+    with pytest.raises(Exception, match="FORBIDDEN error"):
+        await client.graphql("query", {"number": 2}, allow_not_found=True)
+
+
+async def test_concurrent_tool_calls_are_not_capped_at_batch_size(mock_client):
+    in_flight = peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return httpx.Response(200, json={})
+
+    client = mock_client(handler)
+    await asyncio.gather(*(client.request('GET', f'/repos/octo/demo/issues/{n}') for n in range(20)))
+
+    assert peak == 20
+
+
+async def test_get_prefix_retries_rate_limited_responses(mock_client):
+    statuses = iter([429, 206])
+
+    def handler(request):
+        if next(statuses) == 429:
+            return httpx.Response(429, json={}, headers={"Retry-After": "0"})
+        return httpx.Response(206, content=b"hello", headers={"Content-Range": "bytes 0-4/5"})
+
+    client = mock_client(handler)
+    response, body = await client.get_prefix('/repos/octo/demo/contents/README.md', 8)
+
+    assert response.status_code == 206
+    assert body == b"hello"
+
+
+async def test_repeated_get_is_revalidated_and_304_reuses_the_cached_response(mock_client):
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(request.headers)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"name": "demo"},
+                              headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+    client = mock_client(handler)
+    first = await client.request('GET', '/repos/octo/demo')
+    second = await client.request('GET', '/repos/octo/demo')
+
+    assert "If-None-Match" not in seen_headers[0]
+    assert seen_headers[1]["If-None-Match"] == '"v1"'
+    assert seen_headers[1]["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert second is first
+
+
+async def test_conditional_cache_evicts_least_recently_used(mock_client, monkeypatch):
+    monkeypatch.setattr(feather_code, "ETAG_CACHE_SIZE", 2)
+    revalidated = []
+
+    def handler(request):
+        if "If-None-Match" in request.headers:
+            revalidated.append(request.url.path)
+            return httpx.Response(304)
+        return httpx.Response(200, json={}, headers={"ETag": f'"{request.url.path}"'})
+
+    client = mock_client(handler)
+    for path in ('/a', '/b', '/a', '/c', '/a', '/b'):
+        await client.request('GET', path)
+
+    # Re-reading /a made /b the least recently used, so /c evicted it and /b was fetched afresh
+    assert revalidated == ['/a', '/a']
+    assert len(client._etag_cache) == 2
+
+
+async def test_cached_get_reuses_shaped_value_on_304(mock_client):
+    shaped = []
+
+    def handler(request):
+        if "If-None-Match" in request.headers:
+            return httpx.Response(304)
+        return httpx.Response(200, json={"Python": 100}, headers={"ETag": '"v1"'})
+
+    def shape(languages):
+        shaped.append(languages)
+        return sorted(languages)
+
+    client = mock_client(handler)
+    first = await client.cached_get('/repos/octo/demo/languages', shape)
+    second = await client.cached_get('/repos/octo/demo/languages', shape)
+
+    assert first == second == ["Python"]
+    assert len(shaped) == 1
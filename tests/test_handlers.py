@@ -0,0 +1,219 @@
+"""Tests for tool dispatch and error reporting in handle_call_tool"""
+
+import gzip
+
+import httpx
+import orjson
+
+import feather_code
+
+
+async def call(name, arguments=None) -> str:
+    result = await feather_code.handle_call_tool(name, arguments or {})
+    return result[0].text
+
+
+async def test_malformed_github_body_is_not_reported_as_invalid_input(github):
+    github.handler = lambda request: httpx.Response(200, content=b"<html>Unicorn!</html>")
+
+    text = await call("get_repository_languages")
+
+    assert text.startswith("Unexpected response from GitHub")
+
+
+async def test_file_content_links_to_the_file_on_github(github):
+    github.handler = lambda request: httpx.Response(
+        206, content=b"print('hi')\n",
+        headers={"Content-Type": "application/vnd.github.raw", "Content-Range": "bytes 0-11/12"}
+    )
+
+    result = orjson.loads(await call("get_file_content", {"path": "src/app.py", "ref": "release/1.0"}))
+
+    assert result["html_url"] == "https://github.com/octo/demo/blob/release/1.0/src/app.py"
+    assert result["download_url"] == "https://github.com/octo/demo/raw/release/1.0/src/app.py"
+    assert result["content"] == "print('hi')\n"
+
+
+async def test_submodule_is_returned_as_a_file_entry(github):
+    github.handler = lambda request: httpx.Response(200, json={
+        "type": "submodule", "name": "vendor", "path": "lib/vendor", "size": 0,
+        "sha": "a" * 40, "html_url": "https://github.com/octo/vendor/tree/" + "a" * 40, "download_url": None,
+        "submodule_git_url": "https://github.com/octo/vendor.git"
+    })
+
+    result = orjson.loads(await call("get_file_content", {"path": "lib/vendor"}))
+
+    assert result["type"] == "file"
+    assert result["path"] == "lib/vendor"
+    assert result["sha"] == "a" * 40
+    assert result["download_url"] is None
+    assert result["content"] == ""
+
+
+async def test_empty_file_with_json_error_body_is_an_empty_file(github):
+    github.handler = lambda request: httpx.Response(416, json={"message": "Requested range not satisfiable"})
+
+    result = orjson.loads(await call("get_file_content", {"path": "src/__init__.py"}))
+
+    assert result["type"] == "file"
+    assert result["size"] == 0
+    assert result["content"] == ""
+    assert result["html_url"] == "https://github.com/octo/demo/blob/HEAD/src/__init__.py"
+
+
+async def test_file_size_is_reported_when_range_is_ignored(github):
+    body = b"x = 1\n" * 4000
+
+    def handler(request):
+        # A server that ignores Range but honours Accept-Encoding
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            return httpx.Response(200, content=gzip.compress(body), headers={
+                "Content-Type": "application/vnd.github.raw", "Content-Encoding": "gzip"
+            })
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/vnd.github.raw"})
+
+    github.handler = handler
+    result = orjson.loads(await call("get_file_content", {"path": "src/big.py"}))
+
+    assert result["size"] == len(body)
+    assert result["content"].endswith("...")
+
+
+async def test_batch_get_issues_rejects_non_positive_numbers(github):
+    requested = []
+    github.handler = lambda request: requested.append(request) or httpx.Response(500)
+
+    text = await call("batch_get_issues", {"issue_numbers": [3, -1, 0]})
+
+    assert text == "Invalid input: Invalid issue numbers: -1, 0"
+    assert requested == []
+
+
+def issue_node(number, labels):
+    return {
+        "number": number, "title": f"Issue {number}", "state": "OPEN", "url": f"https://github.com/octo/demo/issues/{number}",
+        "body": "", "createdAt": "2024-01-01T00:00:00Z", "updatedAt": "2024-01-01T00:00:00Z",
+        "author": {"login": "octocat"}, "labels": {"nodes": [{"name": name} for name in labels]},
+        "comments": {"totalCount": 0}
+    }
+
+
+async def test_multi_label_issues_keep_paging_until_a_page_of_matches(github):
+    # Page 1 matches "bug" OR "ui" but mostly lacks one of them; page 2 holds the rest of the matches
+    pages = {
+        None: ([issue_node(1, ["bug", "ui"])] + [issue_node(n, ["bug"]) for n in range(2, 100)], "C1"),
+        "C1": ([issue_node(n, ["bug", "ui"]) for n in range(100, 110)], "C2"),
+    }
+    requested = []
+
+    def handler(request):
+        variables = orjson.loads(request.content)["variables"]
+        requested.append(variables)
+        nodes, cursor = pages[variables.get("after")]
+        return httpx.Response(200, json={"data": {"repository": {"issues": {
+            "nodes": nodes, "pageInfo": {"hasNextPage": True, "endCursor": cursor}
+        }}}})
+
+    github.handler = handler
+    issues = orjson.loads(await call("list_issues", {"labels": "bug, ui", "per_page": 3}))
+
+    assert [issue["number"] for issue in issues] == [1, 100, 101]
+    assert len(requested) == 2
+    assert requested[0]["labels"] == ["bug", "ui"]
+
+
+async def test_multi_label_issues_match_label_names_case_insensitively(github):
+    def handler(request):
+        return httpx.Response(200, json={"data": {"repository": {"issues": {
+            "nodes": [issue_node(1, ["bug", "ui"]), issue_node(2, ["bug"])],
+            "pageInfo": {"hasNextPage": False, "endCursor": None}
+        }}}})
+
+    github.handler = handler
+    issues = orjson.loads(await call("list_issues", {"labels": "Bug, UI"}))
+
+    assert [issue["number"] for issue in issues] == [1]
+
+
+def pull_request_handler(requested, rejected_bases=(), default_branch="main"):
+    """Answer the default branch lookup and create PRs, rejecting the given bases with a base 422"""
+    def handler(request):
+        body = orjson.loads(request.content)
+        if request.url.path == "/graphql":
+            requested.append("lookup")
+            return httpx.Response(200, json={"data": {"repository": {"defaultBranchRef": {"name": default_branch}}}})
+        requested.append(body["base"])
+        if body["base"] in rejected_bases:
+            return httpx.Response(422, json={"message": "Validation Failed",
+                                             "errors": [{"resource": "PullRequest", "field": "base", "code": "invalid"}]})
+        return httpx.Response(201, json={
+            "number": 7, "title": body["title"], "html_url": "https://github.com/octo/demo/pull/7", "state": "open",
+            "draft": False, "head": {"ref": body["head"]}, "base": {"ref": body["base"]},
+            "created_at": "2024-01-01T00:00:00Z"
+        })
+    return handler
+
+
+async def test_pull_request_without_base_looks_up_the_default_branch_once(github):
+    requested = []
+    github.handler = pull_request_handler(requested, default_branch="trunk")
+
+    first = orjson.loads(await call("create_pull_request", {"title": "One", "head": "feature"}))
+    second = orjson.loads(await call("create_pull_request", {"title": "Two", "head": "feature"}))
+
+    assert first["base"] == second["base"] == "trunk"
+    assert requested == ["lookup", "trunk", "trunk"]
+
+
+async def test_pull_request_uses_cached_repository_info_for_base(github):
+    requested = []
+    github.handler = pull_request_handler(requested)
+    feather_code._repo_cache[("info", "octo", "demo")] = {"default_branch": "develop"}
+
+    result = orjson.loads(await call("create_pull_request", {"title": "One", "head": "feature"}))
+
+    assert result["base"] == "develop"
+    assert requested == ["develop"]
+
+
+async def test_stale_cached_base_is_refreshed_and_retried_once(github):
+    requested = []
+    github.handler = pull_request_handler(requested, rejected_bases={"master"})
+    feather_code._default_branch_cache[("octo", "demo")] = "master"
+
+    result = orjson.loads(await call("create_pull_request", {"title": "One", "head": "feature"}))
+
+    assert result["base"] == "main"
+    assert requested == ["master", "lookup", "main"]
+    assert feather_code._default_branch_cache.get(("octo", "demo")) == "main"
+
+
+async def test_pull_request_422_not_about_base_is_not_retried(github):
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.path)
+        return httpx.Response(422, json={"message": "A pull request already exists for octo:feature.",
+                                         "errors": [{"resource": "PullRequest", "code": "custom"}]})
+
+    github.handler = handler
+    feather_code._default_branch_cache[("octo", "demo")] = "main"
+
+    text = await call("create_pull_request", {"title": "One", "head": "feature"})
+
+    assert text == "Invalid input: Invalid pull request data: A pull request already exists for octo:feature."
+    assert requested == ["/repos/octo/demo/pulls"]
+
+
+async def test_search_code_clamps_per_page(github):
+    requested = []
+
+    def handler(request):
+        requested.append(request.url.params)
+        return httpx.Response(200, json={"total_count": 0, "items": []})
+
+    github.handler = handler
+    await call("search_code", {"query": "TODO", "per_page": 500})
+
+    assert requested[0]["per_page"] == "100"
+    assert requested[0]["q"] == "TODO repo:octo/demo"